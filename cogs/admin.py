@@ -0,0 +1,342 @@
+import os
+import sys
+import asyncio
+import datetime
+import subprocess
+
+import discord
+from discord.ext import commands
+
+from main import (
+    cleanup_old_files,
+    get_directory_size,
+    get_disk_usage,
+    github_client,
+    http_client,
+    is_admin,
+    is_owner,
+    lazy_import,
+    logger,
+    startup_profiler,
+    url_extractors,
+    video_cache,
+)
+
+psutil = lazy_import("psutil")  # only the status commands need it
+
+
+class AdminCog(commands.Cog):
+    """Status, diagnostics and maintenance commands."""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.command(name='reloadconfig')
+    @commands.check(is_owner)
+    async def reloadconfig(self, ctx):
+        """Reload the config file now and show what is active."""
+        try:
+            snapshot = self.bot.config_store.reload()
+        except Exception as e:
+            await ctx.send(f"❌ โหลด config ไม่สำเร็จ (ยังใช้ v{self.bot.config_store.snapshot.version}): {e}")
+            return
+        await ctx.send("✅ โหลด config ใหม่แล้ว: " + ", ".join(f"{k}: {v}" for k, v in snapshot.summary().items()))
+
+    @commands.command(name='debug')
+    @commands.check(is_owner)
+    async def debug(self, ctx):
+        """Check bot and AI service status."""
+        try:
+            embed = discord.Embed(
+                title="🔧 Debug Information",
+                color=0x00ff00,
+                timestamp=datetime.datetime.now(datetime.UTC)
+            )
+            
+            # AI Provider status
+            embed.add_field(name="Primary Provider", value="OpenAI", inline=True)
+            embed.add_field(name="Fallback Provider", value="Grok-3", inline=True)
+            embed.add_field(name="OpenAI Status", value="✅" if self.bot.ai_service.openai_api_key else "❌", inline=True)
+            embed.add_field(name="Grok-3 Status", value="✅" if self.bot.ai_service.grok_api_key else "❌", inline=True)
+            embed.add_field(name="OpenAI API Key", value="✅" if self.bot.ai_service.openai_api_key else "❌", inline=True)
+            embed.add_field(name="Grok-3 API Key", value="✅" if self.bot.ai_service.grok_api_key else "❌", inline=True)
+            embed.add_field(name="OpenAI Endpoint", value=self.bot.ai_service.openai_endpoint, inline=True)
+            embed.add_field(name="Grok-3 Endpoint", value=self.bot.ai_service.grok_endpoint, inline=True)
+            embed.add_field(name="OpenAI Model", value=self.bot.ai_service.openai_model, inline=True)
+            embed.add_field(name="Grok-3 Model", value=self.bot.ai_service.grok_model, inline=True)
+            embed.add_field(name="Function Calling", value="✅" if self.bot.ai_service.function_schemas else "❌", inline=True)
+            route_usage = ", ".join(f"{tier}: {count}" for tier, count in self.bot.ai_service.route_counts.items())
+            embed.add_field(name="Routing Usage", value=route_usage or "-", inline=False)
+            cache_stats = self.bot.content_cache.stats()
+            embed.add_field(name="URL Cache", value=", ".join(f"{k}: {v}" for k, v in cache_stats.items()), inline=False)
+            embed.add_field(name="HTTP Client", value=", ".join(f"{k}: {v}" for k, v in http_client.stats().items()), inline=False)
+            embed.add_field(name="GitHub API Budget", value=github_client.rate_limit_status(), inline=False)
+            embed.add_field(name="Video Cache", value=", ".join(f"{k}: {v}" for k, v in video_cache.stats().items()), inline=False)
+            if self.bot.brain is not None:
+                embed.add_field(name="Brain Process", value=", ".join(f"{k}: {v}" for k, v in self.bot.brain.stats().items()), inline=False)
+            embed.add_field(name="Startup", value=", ".join(f"{k}: {v}" for k, v in startup_profiler.stats().items()), inline=False)
+            embed.add_field(name="Warm State", value=", ".join(f"{k}: {v}" for k, v in self.bot.warm_state.stats().items()), inline=False)
+            embed.add_field(name="Config", value=", ".join(f"{k}: {v}" for k, v in self.bot.config_store.snapshot.summary().items()), inline=False)
+            embed.add_field(name="Dispatch Queue", value=", ".join(f"{k}: {v}" for k, v in self.bot.dispatcher.stats().items()), inline=False)
+            embed.add_field(name="Outbound Sender", value=", ".join(f"{k}: {v}" for k, v in self.bot.sender.stats().items()), inline=False)
+            embed.add_field(name="Reply Context", value=", ".join(f"{k}: {v}" for k, v in self.bot.reply_resolver.stats().items()), inline=False)
+            embed.add_field(name="Member Directory", value=", ".join(f"{k}: {v}" for k, v in self.bot.members.stats().items()), inline=False)
+            embed.add_field(name="Parse Pool", value=", ".join(f"{k}: {v}" for k, v in self.bot.parse_pool.stats().items()), inline=False)
+            extractor_usage = ", ".join(f"{name}: {st['calls']} ({st['timeouts']} timeouts)" for name, st in url_extractors.stats().items())
+            embed.add_field(name="URL Extractors", value=extractor_usage, inline=False)
+            
+            # Test AI response
+            await ctx.send("Testing AI service...")
+            response = await self.bot.ai_service.get_response("Say 'pong' if you are working.", source="command")
+            embed.add_field(name="AI Test Response", value=response[:100] + "..." if len(response) > 100 else response, inline=False)
+            
+            await ctx.send(embed=embed)
+        except Exception as e:
+            await ctx.send(f"AI service error: {e}")
+
+    @commands.command(name='status')
+    async def status(self, ctx):
+        import platform
+        import datetime
+
+        # Bot stats
+        latency = round(self.bot.latency * 1000)
+        servers = len(self.bot.guilds)
+        users = len(self.bot.users)
+        channels = sum(1 for _ in self.bot.get_all_channels())
+        commands_count = len(self.bot.commands)
+        allowed_channels = ', '.join(str(cid) for cid in self.bot.allowed_channel_ids)
+
+        # System stats
+        cpu_percent = psutil.cpu_percent(interval=1)
+        mem = psutil.virtual_memory()
+        mem_used = f"{mem.used // (1024**2)} MB"
+        mem_total = f"{mem.total // (1024**2)} MB"
+        mem_percent = mem.percent
+        boot_time = datetime.datetime.fromtimestamp(psutil.boot_time()).strftime("%Y-%m-%d %H:%M:%S")
+        python_version = platform.python_version()
+        os_info = f"{platform.system()} {platform.release()} ({platform.version()})"
+        process = psutil.Process(os.getpid())
+        uptime = datetime.datetime.now() - datetime.datetime.fromtimestamp(process.create_time())
+        uptime_str = str(uptime).split('.')[0]
+
+        embed = discord.Embed(
+            title="📊 Bot & System Status",
+            color=0x0099ff,
+            timestamp=datetime.datetime.utcnow()
+        )
+        embed.add_field(name="Latency", value=f"{latency} ms", inline=True)
+        embed.add_field(name="Servers", value=str(servers), inline=True)
+        embed.add_field(name="Users", value=str(users), inline=True)
+        embed.add_field(name="Channels", value=str(channels), inline=True)
+        embed.add_field(name="Commands", value=str(commands_count), inline=True)
+        embed.add_field(name="Allowed Channel IDs", value=allowed_channels, inline=False)
+        embed.add_field(name="Uptime", value=uptime_str, inline=True)
+        embed.add_field(name="Python", value=python_version, inline=True)
+        embed.add_field(name="OS", value=os_info, inline=False)
+        embed.add_field(name="CPU Usage", value=f"{cpu_percent}%", inline=True)
+        embed.add_field(name="Memory Usage", value=f"{mem_used} / {mem_total} ({mem_percent}%)", inline=True)
+        embed.add_field(name="System Boot Time", value=boot_time, inline=False)
+        cluster = await self.bot.get_cluster_status()
+        if cluster:
+            embed.add_field(
+                name=f"Cluster ({len(cluster)} processes)",
+                value="\n".join(
+                    f"#{row['cluster_id']} shards {row['shards']}: {row['guilds']} servers, {row['users']} users, {row['latency_ms']} ms"
+                    for row in cluster
+                ) + f"\nTotal: {sum(row['guilds'] for row in cluster)} servers",
+                inline=False
+            )
+        await ctx.send(embed=embed)
+
+    @commands.command(name='restart')
+    @commands.check(is_owner)
+    async def restart(self, ctx):
+        """Restarts the bot cleanly."""
+        await ctx.send("✅ กำลังรีสตาร์ท...")
+        await asyncio.sleep(1)  # Ensures the message is sent before shutdown
+        
+        # Close the bot gracefully (drains replies, saves memories, bounded by the shutdown deadlines)
+        await self.bot.close()
+        
+        # Start new process; a cluster worker just exits and its launcher respawns it
+        try:
+            if self.bot.cluster_id is None:
+                subprocess.Popen([sys.executable] + sys.argv)
+            # Exit the current process
+            os._exit(0)  # Use os._exit instead of sys.exit to avoid SystemExit exception
+        except Exception as e:
+            logger.error(f"Error during restart: {e}")
+            await ctx.send(f"❌ Error during restart: {e}")
+
+    @commands.command(name='activity')
+    @commands.check(is_owner)
+    async def activity(self, ctx):
+        process = psutil.Process(os.getpid())
+        cpu = psutil.cpu_percent(interval=1)
+        mem = psutil.virtual_memory()
+        uptime = datetime.datetime.now() - datetime.datetime.fromtimestamp(process.create_time())
+        uptime_str = str(uptime).split('.')[0]
+        embed = discord.Embed(
+            title="🤖 Bot Activity",
+            color=0x00bfff,
+            timestamp=datetime.datetime.utcnow()
+        )
+        embed.add_field(name="Uptime", value=uptime_str, inline=True)
+        embed.add_field(name="CPU Usage", value=f"{cpu}%", inline=True)
+        embed.add_field(name="Memory Usage", value=f"{mem.percent}%", inline=True)
+        embed.add_field(name="Current PID", value=str(process.pid), inline=True)
+        embed.add_field(name="Status", value=process.status(), inline=True)
+        embed.add_field(name="Threads", value=str(process.num_threads()), inline=True)
+        embed.add_field(name="Executable", value=process.exe(), inline=False)
+        await ctx.send(embed=embed)
+
+    @commands.command(name='terminal', aliases=['term', 'cmd'])
+    @commands.check(is_owner)
+    async def terminal(self, ctx, *, command: str):
+        """Executes a shell command. Admin only."""
+        async with ctx.typing():
+            try:
+                proc = await asyncio.create_subprocess_shell(
+                    command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=60.0)
+                result = ""
+                if stdout:
+                    result += f"**Output:**\n```\n{stdout.decode('utf-8', errors='ignore')}\n```\n"
+                if stderr:
+                    result += f"**Error:**\n```\n{stderr.decode('utf-8', errors='ignore')}\n```"
+                if not result:
+                    result = "Command executed with no output."
+                if len(result) > 2000:
+                    with open("terminal_output.txt", "w", encoding="utf-8") as f:
+                        f.write(stdout.decode('utf-8', errors='ignore'))
+                        f.write("\n\n---ERRORS---\n\n")
+                        f.write(stderr.decode('utf-8', errors='ignore'))
+                    await ctx.send("Output is too long. Sending as a file.", file=discord.File("terminal_output.txt"))
+                    os.remove("terminal_output.txt")
+                else:
+                    await ctx.send(result)
+            except asyncio.TimeoutError:
+                await ctx.send("Command timed out after 60 seconds.")
+            except Exception as e:
+                await ctx.send(f"An error occurred: {e}")
+
+    @commands.command(name='diskspace', aliases=['disk', 'space'])
+    async def disk_usage(self, ctx):
+        """Check disk usage for bot files and AI models."""
+        if not await is_admin(ctx):
+            await ctx.send("❌ This command is admin-only.")
+            return
+        
+        try:
+            bot_usage = get_disk_usage()
+            hf_cache_size = get_directory_size("hf_cache") if os.path.exists("hf_cache") else 0
+            total_usage = bot_usage + hf_cache_size
+            
+            embed = discord.Embed(
+                title="💾 Disk Usage Report",
+                color=0x00ff00,
+                timestamp=datetime.datetime.now(datetime.UTC)
+            )
+            embed.add_field(name="Bot Files", value=f"{bot_usage:.2f} MB", inline=True)
+            embed.add_field(name="AI Models Cache", value=f"{hf_cache_size:.2f} MB", inline=True)
+            embed.add_field(name="Total Usage", value=f"{total_usage:.2f} MB", inline=True)
+            
+            # Add status indicators
+            bot_status = "🟢 Normal" if bot_usage < 500 else "🟡 High" if bot_usage < 1000 else "🔴 Critical"
+            hf_status = "🟢 Normal" if hf_cache_size < 2000 else "🟡 Large" if hf_cache_size < 5000 else "🔴 Critical"
+            
+            embed.add_field(name="Bot Files Status", value=bot_status, inline=True)
+            embed.add_field(name="AI Cache Status", value=hf_status, inline=True)
+            embed.add_field(name="Auto Cleanup", value="✅ Active", inline=True)
+            
+            await ctx.send(embed=embed)
+            
+        except Exception as e:
+            logger.error(f"Error in disk usage command: {e}")
+            await ctx.send(f"❌ Error checking disk usage: {e}")
+
+    @commands.command(name='clearcache', aliases=['clearhf', 'cleanai'])
+    async def clear_hf_cache(self, ctx):
+        """Clear HuggingFace model cache to free up space."""
+        if not await is_admin(ctx):
+            await ctx.send("❌ This command is admin-only.")
+            return
+        
+        try:
+            hf_cache_path = "hf_cache"
+            if os.path.exists(hf_cache_path):
+                import shutil
+                shutil.rmtree(hf_cache_path)
+                os.makedirs(hf_cache_path)  # Recreate empty directory
+                
+                embed = discord.Embed(
+                    title="🧹 AI Cache Cleared",
+                    description="HuggingFace model cache has been cleared successfully!",
+                    color=0x00ff00,
+                    timestamp=datetime.datetime.now(datetime.UTC)
+                )
+                embed.add_field(name="Next Model Load", value="Will download fresh models", inline=True)
+                embed.add_field(name="Space Freed", value="AI models will be re-downloaded when needed", inline=True)
+                
+                await ctx.send(embed=embed)
+            else:
+                await ctx.send("ℹ️ No HuggingFace cache found to clear.")
+                
+        except Exception as e:
+            logger.error(f"Error clearing HuggingFace cache: {e}")
+            await ctx.send(f"❌ Error clearing cache: {e}")
+
+    @commands.command(name='cleanup', aliases=['clean'])
+    async def cleanup_files(self, ctx):
+        """Clean up old files and optionally AI cache to save disk space."""
+        if not await is_admin(ctx):
+            await ctx.send("❌ This command is admin-only.")
+            return
+        
+        try:
+            # Clean bot files
+            cleanup_old_files()
+            self.bot.memory_manager._cleanup_memories()
+            
+            # Clear old log files
+            if os.path.exists('logs'):
+                log_files = [f for f in os.listdir('logs') if f.startswith('bot.log')]
+                if len(log_files) > 3:
+                    log_files.sort()
+                    for old_log in log_files[:-3]:
+                        try:
+                            os.remove(os.path.join('logs', old_log))
+                        except:
+                            pass
+            
+            bot_usage_after = get_disk_usage()
+            hf_cache_size = get_directory_size("hf_cache") if os.path.exists("hf_cache") else 0
+            
+            embed = discord.Embed(
+                title="🧹 Cleanup Completed",
+                description="Old files and memory have been cleaned up!",
+                color=0x00ff00,
+                timestamp=datetime.datetime.now(datetime.UTC)
+            )
+            embed.add_field(name="Bot Files Usage", value=f"{bot_usage_after:.2f} MB", inline=True)
+            embed.add_field(name="AI Cache Size", value=f"{hf_cache_size:.2f} MB", inline=True)
+            
+            if hf_cache_size > 2000:
+                embed.add_field(
+                    name="💡 Suggestion", 
+                    value="AI cache is large. Use `!clearcache` to free more space.", 
+                    inline=False
+                )
+            
+            await ctx.send(embed=embed)
+            
+        except Exception as e:
+            logger.error(f"Error in cleanup command: {e}")
+            await ctx.send(f"❌ Cleanup failed: {e}")
+
+async def setup(bot):
+    await bot.add_cog(AdminCog(bot))
@@ -0,0 +1,127 @@
+import datetime
+
+import discord
+from discord.ext import commands
+
+from main import BOT_CONFIG_FILE, get_disk_usage, is_owner, lazy_import
+
+psutil = lazy_import("psutil")  # only !diagnose needs it
+
+
+class AICog(commands.Cog):
+    """AI provider status and prompt commands."""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.command(name='setprompt')
+    @commands.check(is_owner)
+    async def setprompt(self, ctx, *, prompt: str):
+        self.bot.ai_service.set_system_prompt(prompt)
+        message = f"ตั้งค่า AI system prompt ใหม่เรียบร้อย:\n```{prompt}```"
+        # Prompts in bot_config.json (channel, then guild, then global) take precedence over this one
+        if self.bot.config_store.snapshot.system_prompt_for(ctx.guild.id if ctx.guild else None, ctx.channel.id):
+            message += (f"\n⚠️ {BOT_CONFIG_FILE} sets a system_prompt for this channel, server or globally, "
+                        "which takes precedence here; edit it there and use !reloadconfig.")
+        await ctx.send(message)
+
+    @commands.command(name='ai', aliases=['provider', 'model'])
+    async def ai_status(self, ctx):
+        """Show current AI provider status."""
+        embed = discord.Embed(
+            title="🤖 AI Provider Status",
+            color=0x00ff00,
+            timestamp=datetime.datetime.now(datetime.UTC)
+        )
+        
+        # Current provider
+        embed.add_field(name="Primary Provider", value="🔄 OpenAI", inline=True)
+        embed.add_field(name="Fallback Provider", value="🦘 Grok-3", inline=True)
+        
+        # OpenAI status
+        openai_status = "✅ Available" if self.bot.ai_service.openai_api_key else "❌ Not Available"
+        embed.add_field(name="OpenAI Status", value=openai_status, inline=True)
+        
+        # Grok-3 status
+        grok_status = "✅ Available" if self.bot.ai_service.grok_api_key else "❌ Not Available"
+        embed.add_field(name="Grok-3 Status", value=grok_status, inline=True)
+        
+        # Model info
+        embed.add_field(name="OpenAI Model", value=self.bot.ai_service.openai_model, inline=True)
+        embed.add_field(name="Grok-3 Model", value=self.bot.ai_service.grok_model, inline=True)
+        
+        # Function calling info
+        embed.add_field(name="Function Calling", value="✅ Available (OpenAI only)", inline=True)
+        embed.add_field(name="Available Functions", value="getFlightInfo", inline=True)
+        
+        # Routing tiers
+        routing_text = "\n".join(
+            f"• {tier}: {route['model']} ({route['max_tokens']} tokens)"
+            for tier, route in self.bot.ai_service.routing_table.items()
+        )
+        embed.add_field(name="🧭 Model Routing", value=routing_text, inline=False)
+        
+        # Usage instructions
+        embed.add_field(
+            name="💡 AI Service", 
+            value="Using OpenAI with Grok-3 fallback. When OpenAI hits rate limits, Grok-3 will be used automatically.", 
+            inline=False
+        )
+        
+        embed.add_field(
+            name="🔄 Fallback Logic", 
+            value="1. Try OpenAI first\n2. If rate limited → Use Grok-3\n3. If both fail → Use fallback responses", 
+            inline=False
+        )
+        
+        await ctx.send(embed=embed)
+
+    @commands.command(name='diagnose')
+    @commands.check(is_owner)
+    async def diagnose(self, ctx):
+        """Diagnose bot issues using AI."""
+        try:
+            # Get system information
+            cpu_percent = psutil.cpu_percent()
+            memory = psutil.virtual_memory()
+            disk_usage = get_disk_usage()
+            
+            # Read recent log entries
+            log_entries = []
+            try:
+                with open('logs/bot.log', 'r', encoding='utf-8') as f:
+                    log_entries = f.readlines()[-20:]  # Last 20 lines
+            except:
+                pass
+            
+            # Create diagnosis prompt
+            diagnosis_prompt = f"""
+            System Status:
+            - CPU Usage: {cpu_percent}%
+            - Memory Usage: {memory.percent}%
+            - Disk Usage: {disk_usage:.2f} MB
+            
+            Recent Log Entries:
+            {''.join(log_entries)}
+            
+            Please analyze the bot's health and provide recommendations for any issues.
+            """
+            
+            # Get AI diagnosis using the async method
+            response = await self.bot.ai_service.get_response(diagnosis_prompt, source="command")
+            
+            # Create embed
+            embed = discord.Embed(
+                title="🤖 Bot Diagnosis",
+                description=response[:2000],
+                color=0x00ff00
+            )
+            embed.add_field(name="System Info", value=f"CPU: {cpu_percent}% | RAM: {memory.percent}% | Disk: {disk_usage:.2f}MB", inline=False)
+            
+            await ctx.send(embed=embed)
+            
+        except Exception as e:
+            await ctx.send(f"❌ Diagnosis failed: {str(e)}")
+
+async def setup(bot):
+    await bot.add_cog(AICog(bot))
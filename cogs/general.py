@@ -0,0 +1,112 @@
+import discord
+from discord.ext import commands
+
+
+class GeneralCog(commands.Cog):
+    """Greeting and help commands."""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.command(name='test', aliases=['ping', 'pong'])
+    async def test_command(self, ctx):
+        """Simple test command to check if bot is working."""
+        await ctx.send("✅ Bot is working! Pong! 🏓")
+
+    @commands.command(name='hello', aliases=['hi', 'สวัสดี'])
+    async def hello(self, ctx):
+        highlighted_name = f' |`{ctx.author.display_name}`| '
+        await ctx.send(f'Hello {highlighted_name} นะไอ้โง่!')
+
+    @commands.command(name='help', aliases=['h'])
+    async def help_command(self, ctx):
+        embed = discord.Embed(
+            title="📚 คำสั่งที่มีในบอท",
+            description="รวมคำสั่งทั้งหมดของบอทนี้",
+            color=0x00ff00
+        )
+        # General commands
+        embed.add_field(name=f"{self.bot.config.command_prefix}hello", value="ทักทายบอท", inline=False)
+        embed.add_field(name=f"{self.bot.config.command_prefix}help", value="แสดงข้อความช่วยเหลือนี้", inline=False)
+        embed.add_field(name=f"{self.bot.config.command_prefix}status", value="แสดงสถานะของบอทและระบบ", inline=False)
+        embed.add_field(name="การแชทกับ AI", value="พิมพ์ข้อความธรรมดาในห้องที่กำหนดเพื่อคุยกับ AI (OpenAI + Grok-3 Fallback)", inline=False)
+        embed.add_field(name="🔄 Reply to Messages", value="กด Reply บนข้อความเพื่อให้บอทตอบกลับข้อความนั้นโดยตรง", inline=False)
+        embed.add_field(name="🌐 URL Analysis", value="บอทจะอ่านและวิเคราะห์เว็บไซต์อัตโนมัติเมื่อพบ URL ในข้อความ", inline=False)
+        
+        # Memory commands
+        embed.add_field(name="\u200b", value="--- 🧠 **Memory Commands** ---", inline=False)
+        embed.add_field(name=f"{self.bot.config.command_prefix}profile [@user]", value="ดูข้อมูลและบุคลิกภาพของผู้ใช้", inline=False)
+        embed.add_field(name=f"{self.bot.config.command_prefix}memory", value="ดูสถิติความจำของบอท", inline=False)
+        embed.add_field(name=f"{self.bot.config.command_prefix}thread [message_id]", value="ดูการสนทนาล่าสุดหรือ thread เฉพาะ", inline=False)
+        embed.add_field(name=f"{self.bot.config.command_prefix}forget [@user]", value="ลบข้อมูลของผู้ใช้จากความจำ (Owner only)", inline=False)
+        
+        # Separator for Admin commands
+        embed.add_field(name="\u200b", value="--- 🔒 **Admin Commands (Owner only)** ---", inline=False)
+
+        # Admin commands (Owner only)
+        embed.add_field(name=f"{self.bot.config.command_prefix}setprompt [ข้อความ]", value="ตั้งค่า AI system prompt ใหม่ (เปลี่ยนบุคลิก AI)", inline=False)
+        embed.add_field(name=f"{self.bot.config.command_prefix}ai", value="แสดงสถานะ AI provider", inline=False)
+        embed.add_field(name=f"{self.bot.config.command_prefix}restart", value="รีสตาร์ทบอท", inline=False)
+        embed.add_field(name=f"{self.bot.config.command_prefix}reload [module]", value="โหลดโค้ดคำสั่งใหม่โดยไม่ต้องรีสตาร์ท (Owner only)", inline=False)
+        embed.add_field(name=f"{self.bot.config.command_prefix}terminal [command]", value="รันคำสั่ง shell บนเครื่องที่บอททำงานอยู่", inline=False)
+        embed.add_field(name=f"{self.bot.config.command_prefix}diagnose", value="ให้ AI วิเคราะห์ข้อผิดพลาดจาก `bot.log`", inline=False)
+        embed.add_field(name=f"{self.bot.config.command_prefix}diskspace", value="ตรวจสอบการใช้พื้นที่ดิสก์", inline=False)
+        embed.add_field(name=f"{self.bot.config.command_prefix}cleanup", value="ลบไฟล์เก่าเพื่อประหยัดพื้นที่ดิสก์ (Owner only)", inline=False)
+        embed.add_field(name=f"{self.bot.config.command_prefix}clearcache", value="ลบ HuggingFace AI cache (Owner only)", inline=False)
+        embed.add_field(name=f"{self.bot.config.command_prefix}activity", value="ดูสถานะการทำงานของบอท (Owner only)", inline=False)
+        embed.add_field(name=f"{self.bot.config.command_prefix}debug", value="ดู debug ข้อมูลบอท (Owner only)", inline=False)
+        
+        # URL Analysis commands
+        embed.add_field(name="\u200b", value="--- 🌐 **URL Analysis Commands** ---", inline=False)
+        embed.add_field(name=f"{self.bot.config.command_prefix}analyze [URL]", value="วิเคราะห์เว็บไซต์จาก URL ที่กำหนด", inline=False)
+        
+        embed.add_field(name="\u200b", value="\n**หมายเหตุ:** คำสั่งในหมวด Admin ใช้ได้เฉพาะ Owner เท่านั้น!", inline=False)
+        
+        await ctx.send(embed=embed)
+
+    @commands.command(name='reply', aliases=['r', 'ตอบกลับ'])
+    async def reply_help(self, ctx):
+        """Show how to use the reply feature."""
+        embed = discord.Embed(
+            title="🔄 How to Reply to Messages",
+            description="เรียนรู้วิธีให้บอทตอบกลับข้อความเฉพาะ",
+            color=0x00ff00
+        )
+        
+        embed.add_field(
+            name="📱 วิธีใช้",
+            value="1. กดปุ่ม **Reply** บนข้อความที่ต้องการตอบกลับ\n"
+                  "2. พิมพ์ข้อความของคุณ\n"
+                  "3. บอทจะตอบกลับข้อความนั้นโดยตรง",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="💡 ตัวอย่าง",
+            value="**ข้อความเดิม:** 'ใครรู้จัก Python ไหม?'\n"
+                  "**คุณ Reply:** 'ผมรู้จักครับ มันเป็นภาษาโปรแกรมมิ่ง'\n"
+                  "**บอทจะตอบ:** [ตอบกลับข้อความเดิมพร้อมคำอธิบายเพิ่มเติม]",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="🎯 ประโยชน์",
+            value="• ตอบคำถามได้ตรงประเด็น\n"
+                  "• ต่อยอดจากข้อความเดิม\n"
+                  "• สร้างบทสนทนาที่ต่อเนื่อง\n"
+                  "• จำบริบทได้ดีขึ้น",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="⚠️ หมายเหตุ",
+            value="• ต้องใช้ในห้องที่บอททำงานอยู่\n"
+                  "• บอทจะจำข้อความที่ตอบกลับ\n"
+                  "• สามารถตอบกลับข้อความของตัวเองได้",
+            inline=False
+        )
+        
+        await ctx.send(embed=embed)
+
+async def setup(bot):
+    await bot.add_cog(GeneralCog(bot))
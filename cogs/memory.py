@@ -0,0 +1,130 @@
+import datetime
+
+import discord
+from discord.ext import commands
+
+from main import is_owner
+
+
+class MemoryCog(commands.Cog):
+    """Commands for viewing and editing the bot's memory."""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.command(name='profile', aliases=['user', 'personality'])
+    async def profile(self, ctx, user: discord.Member = None):
+        """Show user profile and personality data."""
+        if user is None:
+            user = ctx.author
+        
+        user_id = str(user.id)
+        if user_id not in self.bot.memory_manager.user_personalities:
+            await ctx.send(f"❌ ไม่มีข้อมูลของ {user.display_name} ในความจำของบอท")
+            return
+        
+        user_data = self.bot.memory_manager.user_personalities[user_id]
+        
+        embed = discord.Embed(
+            title=f"🧠 Profile: {user.display_name}",
+            color=0x00ff00,
+            timestamp=datetime.datetime.utcnow()
+        )
+        
+        embed.add_field(name="📊 Messages", value=str(user_data["message_count"]), inline=True)
+        embed.add_field(name="👋 First Seen", value=user_data["first_seen"][:10], inline=True)
+        embed.add_field(name="🕒 Last Active", value=user_data["last_interaction"][:10], inline=True)
+        
+        if user_data["personality_traits"]:
+            traits = ", ".join(user_data["personality_traits"])
+            embed.add_field(name="🎭 Personality", value=traits, inline=False)
+        
+        if user_data["topics"]:
+            top_topics = sorted(user_data["topics"].items(), key=lambda x: x[1], reverse=True)[:5]
+            topics_text = "\n".join([f"• {topic}: {count} times" for topic, count in top_topics])
+            embed.add_field(name="🎯 Interests", value=topics_text, inline=False)
+        
+        await ctx.send(embed=embed)
+
+    @commands.command(name='memory', aliases=['mem', 'stats'])
+    async def memory_stats(self, ctx):
+        """Show bot memory statistics."""
+        total_users = len(self.bot.memory_manager.user_personalities)
+        total_chats = len(self.bot.memory_manager.chat_history)
+        
+        embed = discord.Embed(
+            title="🧠 Bot Memory Statistics",
+            color=0x00ff00,
+            timestamp=datetime.datetime.utcnow()
+        )
+        
+        embed.add_field(name="👥 Users Remembered", value=str(total_users), inline=True)
+        embed.add_field(name="💬 Chat Entries", value=str(total_chats), inline=True)
+        if self.bot.memory_manager.store is not None:
+            embed.add_field(name="📁 Memory Store", value=self.bot.memory_manager.store.path, inline=False)
+            cluster = await self.bot.get_cluster_status()
+            if cluster:
+                embed.add_field(
+                    name="🧩 Cluster Memory",
+                    value="\n".join(f"#{row['cluster_id']}: {row['memory_users']} users, {row['memory_chats']} chats" for row in cluster),
+                    inline=False
+                )
+        else:
+            embed.add_field(name="📁 Memory Files", value="brain_chat_memory.txt, user_personalities.json", inline=False)
+        
+        if total_users > 0:
+            most_active = max(self.bot.memory_manager.user_personalities.items(), 
+                            key=lambda x: x[1]["message_count"])
+            embed.add_field(name="🏆 Most Active User", 
+                          value=f"{most_active[1]['username']} ({most_active[1]['message_count']} messages)", 
+                          inline=False)
+        
+        await ctx.send(embed=embed)
+
+    @commands.command(name='thread', aliases=['t', 'conversation'])
+    async def view_thread(self, ctx, message_id: str = None):
+        """View conversation thread around a message."""
+        if not message_id:
+            # If no message ID provided, show recent conversations
+            recent_chats = self.bot.memory_manager.get_recent_chat_context(5)
+            if recent_chats:
+                embed = discord.Embed(
+                    title="💬 Recent Conversations",
+                    description=f"```\n{recent_chats}\n```",
+                    color=0x00ff00
+                )
+                embed.add_field(
+                    name="💡 Tip", 
+                    value="Use `!thread <message_id>` to view specific conversation thread",
+                    inline=False
+                )
+                await ctx.send(embed=embed)
+            else:
+                await ctx.send("❌ ไม่มีข้อมูลการสนทนาล่าสุด")
+            return
+        
+        # Get conversation thread for specific message
+        thread = self.bot.memory_manager.get_conversation_thread(message_id, 10)
+        if thread:
+            thread_text = "\n".join(thread)
+            embed = discord.Embed(
+                title=f"🧵 Conversation Thread (ID: {message_id})",
+                description=f"```\n{thread_text}\n```",
+                color=0x00ff00
+            )
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send(f"❌ ไม่พบการสนทนาที่เกี่ยวข้องกับ ID: {message_id}")
+
+    @commands.command(name='forget')
+    @commands.check(is_owner)
+    async def forget_user(self, ctx, user: discord.Member):
+        """Remove user data from bot memory (Owner only)."""
+        user_id = str(user.id)
+        if self.bot.memory_manager.forget_user(user_id):
+            await ctx.send(f"✅ ลบข้อมูลของ {user.display_name} ออกจากความจำแล้ว")
+        else:
+            await ctx.send(f"❌ ไม่พบข้อมูลของ {user.display_name} ในความจำ")
+
+async def setup(bot):
+    await bot.add_cog(MemoryCog(bot))
@@ -0,0 +1,85 @@
+import datetime
+
+import discord
+from discord.ext import commands
+
+from main import detect_platform, is_valid_url, logger
+
+
+class WebCog(commands.Cog):
+    """URL analysis command."""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.command(name='analyze', aliases=['url', 'read'])
+    async def analyze_url(self, ctx, url: str):
+        """Analyze a website or platform URL."""
+        if not is_valid_url(url):
+            await ctx.send("❌ URL ไม่ถูกต้อง กรุณาใส่ URL ที่ถูกต้อง")
+            return
+        
+        async with ctx.typing():
+            try:
+                await ctx.send(f"🔍 กำลังอ่านและวิเคราะห์: {url}")
+                
+                # Use the new platform-aware analyzer
+                content = await self.bot.analyze_url(url)
+                
+                if content.startswith("Error") or content.startswith("❌"):
+                    await ctx.send(f"❌ ไม่สามารถอ่านหรือวิเคราะห์ได้: {content}")
+                    return
+                
+                # Ask AI to provide a comprehensive summary
+                platform = detect_platform(url)
+                if platform == 'website':
+                    prompt = f"""
+                    วิเคราะห์เนื้อหาจากเว็บไซต์นี้และสรุปให้เข้าใจง่าย:
+
+                    URL: {url}
+                    เนื้อหา:
+                    {content}
+
+                    กรุณาให้สรุปที่ครอบคลุมและเข้าใจง่าย:
+                    1. **หัวข้อหลัก** - สรุปหัวข้อสำคัญ
+                    2. **ประเด็นสำคัญ** - จุดสำคัญที่ควรรู้ (3-5 ข้อ)
+                    3. **ข้อมูลเพิ่มเติม** - ข้อมูลที่น่าสนใจอื่นๆ
+                    4. **สรุปโดยรวม** - ความคิดเห็นหรือข้อสังเกต
+
+                    ใช้ภาษาไทยที่เข้าใจง่ายและกระชับ
+                    """
+                else:
+                    prompt = f"""
+                    วิเคราะห์เนื้อหาจาก {platform} และสรุปให้เข้าใจง่าย:
+
+                    URL: {url}
+                    ข้อมูล:
+                    {content}
+
+                    กรุณาให้สรุปที่ครอบคลุมและเข้าใจง่าย:
+                    1. **ข้อมูลหลัก** - สรุปข้อมูลสำคัญ
+                    2. **ประเด็นที่น่าสนใจ** - จุดเด่นหรือข้อมูลที่น่าสนใจ
+                    3. **สรุปโดยรวม** - ความคิดเห็นหรือข้อสังเกต
+
+                    ใช้ภาษาไทยที่เข้าใจง่ายและกระชับ
+                    """
+                
+                ai_summary = await self.bot.ai_service.get_response(prompt, source="command")
+                
+                embed = discord.Embed(
+                    title=f"🌐 การวิเคราะห์: {url}",
+                    description=ai_summary[:4000],
+                    color=0x00ff00,
+                    url=url
+                )
+                embed.add_field(name="📊 แพลตฟอร์ม", value=platform.upper(), inline=True)
+                embed.add_field(name="⏰ เวลาวิเคราะห์", value=datetime.datetime.now().strftime("%H:%M:%S"), inline=True)
+                
+                await ctx.send(embed=embed)
+                
+            except Exception as e:
+                logger.error(f"Error in analyze command: {e}", exc_info=True)
+                await ctx.send(f"❌ เกิดข้อผิดพลาดที่ไม่คาดคิดในการวิเคราะห์: {e}")
+
+async def setup(bot):
+    await bot.add_cog(WebCog(bot))
@@ -0,0 +1,26 @@
+import asyncio
+
+import main
+
+
+def test_restarted_brain_keeps_system_prompt(tmp_path, monkeypatch):
+    # The brain saves memories and logs relative to its working directory
+    monkeypatch.chdir(tmp_path)
+
+    async def scenario():
+        brain = main.BrainClient(timeout=60)
+        brain.start()
+        try:
+            brain.post("ai.set_system_prompt", "You are a pirate.")
+            assert await brain.call("ai.get_system_prompt") == "You are a pirate."
+
+            brain._process.kill()
+            brain._process.join(10)
+
+            # The next call notices the crash, restarts the brain and replays its state first
+            assert await brain.call("ai.get_system_prompt") == "You are a pirate."
+            assert brain.restarts == 1
+        finally:
+            await asyncio.get_running_loop().run_in_executor(None, brain.stop)
+
+    asyncio.run(scenario())
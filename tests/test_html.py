@@ -0,0 +1,27 @@
+import pytest
+
+import main
+
+THAI_TITLE = "ข่าววันนี้"
+THAI_PAGE = (
+    "<html><head><title>" + THAI_TITLE + "</title></head><body><article><p>"
+    + "ประเทศไทยมีฝนตกหนักในหลายจังหวัดวันนี้ " * 5
+    + "</p></article></body></html>"
+).encode("utf-8")
+
+
+@pytest.mark.parametrize("backend", main.available_html_backends())
+def test_undeclared_utf8_page_is_not_read_as_latin1(backend):
+    # No charset in the headers, no BOM and no <meta charset>: must default to UTF-8
+    sink = main.ArticleExtractorSink()
+    parser = main.create_html_parser(sink, None, backend)
+    for start in range(0, len(THAI_PAGE), 100):
+        parser.feed(THAI_PAGE[start:start + 100])
+    parser.close()
+    assert sink.result()["title"] == THAI_TITLE
+
+
+def test_sniff_html_encoding():
+    assert main.sniff_html_encoding(THAI_PAGE) == ("utf-8", 0)
+    assert main.sniff_html_encoding(b'<meta charset="TIS-620">') == ("tis-620", 0)
+    assert main.sniff_html_encoding(b"\xef\xbb\xbf<html>") == ("utf-8", 3)